@@ -1,8 +1,21 @@
 """Ball component for the pythonpaddle game."""
-import os
+import collections
+import itertools
 import pygame
+import pygame.gfxdraw
 from pythonpaddle.utils.config import CONFIG
-from pythonpaddle.core.physics import BallPhysics, CollisionDetector
+from pythonpaddle.core.physics import BallPhysics
+from pythonpaddle.utils.sound_manager import SoundId, get_sound_manager
+
+
+class _NoopSound:
+    """Stand-in for a pygame Sound that could not be loaded."""
+    
+    def play(self):
+        """Do nothing."""
+
+
+_NOOP_SOUND = _NoopSound()
 
 
 class Ball:
@@ -11,50 +24,60 @@ class Ball:
     def __init__(self):
         """Initialize the ball with default values."""
         self.size = CONFIG.BALL_SIZE
-        self.reset()
         
         # For special effects - reduce trail complexity
-        self.trail = []
         self.max_trail_length = 3  # Reduced from 5 to reduce complexity
         self.trail_opacity = 120
         
-        # Sound setup with safer loading
-        self.has_sounds = False
+        self.reset()
         
-        if CONFIG.SOUND_ENABLED:
-            try:
-                # Get the correct sound directory path
-                base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-                sound_dir = os.path.join(base_dir, "assets", "sounds")
-                
-                paddle_hit_path = os.path.join(sound_dir, "paddle_hit.wav")
-                wall_hit_path = os.path.join(sound_dir, "wall_hit.wav")
-                score_path = os.path.join(sound_dir, "score.wav")
-                
-                # Only try to load if the files exist
-                if os.path.exists(paddle_hit_path):
-                    self.paddle_sound = pygame.mixer.Sound(paddle_hit_path)
-                    self.paddle_sound.set_volume(0.5)
-                    
-                if os.path.exists(wall_hit_path):
-                    self.wall_sound = pygame.mixer.Sound(wall_hit_path)
-                    self.wall_sound.set_volume(0.4)
-                    
-                if os.path.exists(score_path):
-                    self.score_sound = pygame.mixer.Sound(score_path)
-                    self.score_sound.set_volume(0.6)
-                    
-                self.has_sounds = True
-                
-            except Exception as e:
-                print(f"Sound loading error (continuing without sound): {e}")
-                self.has_sounds = False
+        # Pre-render the trail circles once onto per-alpha SRCALPHA surfaces.
+        # Drawing RGBA onto the opaque screen ignores alpha, and re-rasterizing
+        # the circles every frame is wasted work.
+        self._trail_surfs = []
+        for i in range(self.max_trail_length):
+            size = max(4, self.size - (self.max_trail_length - i) * 2)
+            opacity = int(100 * (i / self.max_trail_length))
+            surf = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+            pygame.gfxdraw.filled_circle(
+                surf,
+                self.size // 2,
+                self.size // 2,
+                size // 2,
+                (255, 255, 255, opacity)  # White with fading opacity
+            )
+            self._trail_surfs.append(surf.convert_alpha())
+        
+        # Pre-render the ball itself (with a 1px border for the anti-aliased edge)
+        self._ball_offset = (self.size + 2) // 2
+        ball_surf = pygame.Surface((self.size + 2, self.size + 2), pygame.SRCALPHA)
+        pygame.gfxdraw.aacircle(
+            ball_surf, self._ball_offset, self._ball_offset, self.size // 2, CONFIG.WHITE)
+        pygame.gfxdraw.filled_circle(
+            ball_surf, self._ball_offset, self._ball_offset, self.size // 2, CONFIG.WHITE)
+        self._ball_surf = ball_surf.convert_alpha()
+        
+        # Sounds come from the shared manager, which loads them once per process.
+        # Every sound attribute always exists, falling back to a silent
+        # stand-in, so update() can play them directly.
+        sound_manager = get_sound_manager()
+        self.has_sounds = sound_manager.enabled
+        self.paddle_sound = self.wall_sound = self.score_sound = _NOOP_SOUND
+        if self.has_sounds:
+            sounds = [_NOOP_SOUND if sound is None else sound for sound in sound_manager.sounds]
+            self.paddle_sound = sounds[SoundId.PADDLE_HIT]
+            self.wall_sound = sounds[SoundId.WALL_HIT]
+            self.score_sound = sounds[SoundId.SCORE]
     
     def reset(self):
         """Reset ball to initial position and give it a random direction."""
         self.position_x = CONFIG.WINDOW_WIDTH // 2
         self.position_y = CONFIG.WINDOW_HEIGHT // 2
         
+        # Integer draw coordinates, refreshed once per update
+        self._ix = int(self.position_x)
+        self._iy = int(self.position_y)
+        
         # Set random initial velocity
         self.velocity_x, self.velocity_y = BallPhysics.generate_initial_velocity()
         
@@ -66,57 +89,50 @@ class Ball:
             self.size
         )
         
-        # Reset trail
-        self.trail = []
+        # Reset trail (the deque drops the oldest position on append)
+        self.trail = collections.deque(maxlen=self.max_trail_length)
     
-    def update(self, dt, paddles):
+    def update(self, dt, paddle_tree):
         """
         Update the ball's position and handle collisions.
         
         Args:
-            dt: Delta time for frame-rate independent physics
-            paddles: List of paddle objects to check collisions against
+            dt: Delta time for frame-rate independent physics (already capped by the engine)
+            paddle_tree: AABBTree indexing the paddles to check collisions against
         
         Returns:
             int: 0 if no score, 1 if right player scored, -1 if left player scored
         """
-        # Safety check for extreme dt values that could cause physics issues
-        if dt > 0.1:  # Cap dt to avoid physics bugs on slow machines
-            dt = 0.1
+        # Bind config values once for the rest of the update
+        width, height = CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT
+        half_width = width >> 1
+        size = self.size
+        half_size = size // 2
         
         # Store previous position for trail
-        prev_pos = (self.position_x, self.position_y)
-        
-        # Calculate new position
-        self.position_x += self.velocity_x * dt * 60
-        self.position_y += self.velocity_y * dt * 60
-        
-        # Update the rect for collision detection
-        self.rect.x = self.position_x - self.size // 2
-        self.rect.y = self.position_y - self.size // 2
-        
-        # Handle wall collisions (top and bottom)
-        if CollisionDetector.check_ball_wall_collision(self, CONFIG.WINDOW_HEIGHT):
-            self.velocity_y = BallPhysics.calculate_wall_collision(self.velocity_y)
-            # Ensure ball stays in bounds
-            if self.rect.top < 0:
-                self.rect.top = 0
-                self.position_y = self.rect.centery
-            elif self.rect.bottom > CONFIG.WINDOW_HEIGHT:
-                self.rect.bottom = CONFIG.WINDOW_HEIGHT
-                self.position_y = self.rect.centery
-                
-            if self.has_sounds and hasattr(self, 'wall_sound'):
-                try:
-                    self.wall_sound.play()
-                except:
-                    pass  # Ignore sound errors
-        
-        # Handle paddle collisions
-        for paddle in paddles:
-            if CollisionDetector.check_ball_paddle_collision(self, paddle):
+        prev_pos = (self._ix, self._iy)
+        
+        # Move and bounce off the top and bottom walls. The float position is
+        # the source of truth; the rect is only synced once collisions have
+        # been resolved.
+        position_x, position_y, self.velocity_y, hit_wall = BallPhysics.step_ball(
+            self, dt, height)
+        if hit_wall:
+            self.wall_sound.play()
+        
+        self.position_x, self.position_y = position_x, position_y
+        
+        # Handle paddle collisions against the ball's (x0, y0, x1, y1) bounds,
+        # running the exact test only on paddles the broad phase returns
+        left = position_x - half_size
+        top = position_y - half_size
+        bounds = (left, top, left + size, top + size)
+        for paddle in paddle_tree.query_box(bounds):
+            pr = paddle.rect
+            if bounds[0] < pr.x + pr.w and bounds[2] > pr.x and \
+               bounds[1] < pr.y + pr.h and bounds[3] > pr.y:
                 # Determine which side the paddle is on
-                is_left_paddle = paddle.position_x < CONFIG.WINDOW_WIDTH // 2
+                is_left_paddle = paddle.position_x < half_width
                 
                 # Calculate new velocity based on physics
                 self.velocity_x, self.velocity_y = BallPhysics.calculate_collision_velocity(
@@ -128,36 +144,37 @@ class Ball:
                 
                 # Prevent the ball from getting stuck in the paddle
                 if is_left_paddle:  # Left paddle
-                    self.rect.left = paddle.rect.right
-                    self.position_x = self.rect.centerx
+                    left = pr.x + pr.w
                 else:  # Right paddle
-                    self.rect.right = paddle.rect.left
-                    self.position_x = self.rect.centerx
+                    left = pr.x - size
+                position_x = self.position_x = left + half_size
+                bounds = (left, top, left + size, top + size)
                 
-                if self.has_sounds and hasattr(self, 'paddle_sound'):
-                    try:
-                        self.paddle_sound.play()
-                    except:
-                        pass  # Ignore sound errors
+                self.paddle_sound.play()
                 
                 # Create a trail on paddle hit (simplified)
                 self.trail.append(prev_pos)
         
         # Check if the ball is out of bounds (scoring)
-        goal_result = CollisionDetector.check_ball_goal_collision(self, CONFIG.WINDOW_WIDTH)
+        if left + size >= width:
+            goal_result = -1  # Left player scored
+        elif left <= 0:
+            goal_result = 1  # Right player scored
+        else:
+            goal_result = 0
         if goal_result != 0:
-            if self.has_sounds and hasattr(self, 'score_sound'):
-                try:
-                    self.score_sound.play()
-                except:
-                    pass  # Ignore sound errors
+            self.score_sound.play()
             self.reset()
             return goal_result
         
-        # Update trail (simplified)
-        self.trail.append((self.position_x, self.position_y))
-        while len(self.trail) > self.max_trail_length:
-            self.trail.pop(0)
+        # Sync the collision rect once, now that the position is final
+        self.rect.x = left
+        self.rect.y = top
+        
+        # Round to draw coordinates once, then update trail (simplified)
+        self._ix = int(position_x)
+        self._iy = int(position_y)
+        self.trail.append((self._ix, self._iy))
         
         return 0  # No scoring
     
@@ -170,23 +187,17 @@ class Ball:
         """
         # Simplified trail rendering
         if len(self.trail) > 1:
-            for i, (x, y) in enumerate(self.trail[:-1]):  # Don't render the last position (current ball position)
-                # Simpler trail effect
-                size = max(4, self.size - (len(self.trail) - i) * 2)
-                opacity = int(100 * (i / len(self.trail)))
-                
-                # Draw simplified trail
-                pygame.draw.circle(
-                    screen,
-                    (255, 255, 255, opacity),  # White with fading opacity
-                    (int(x), int(y)),
-                    size // 2
-                )
-        
-        # Draw the ball (as a circle for simplicity and better performance)
-        pygame.draw.circle(
-            screen, 
-            CONFIG.WHITE, 
-            (int(self.position_x), int(self.position_y)),
-            self.size // 2
+            half_size = self.size // 2
+            # Submit all trail segments in a single batched blit
+            # Don't render the last position (current ball position)
+            screen.blits(
+                [(self._trail_surfs[i], (x - half_size, y - half_size))
+                 for i, (x, y) in enumerate(itertools.islice(self.trail, 0, len(self.trail) - 1))],
+                doreturn=False
+            )
+        
+        # Draw the ball from the pre-rendered surface
+        screen.blit(
+            self._ball_surf,
+            (self._ix - self._ball_offset, self._iy - self._ball_offset)
         )
\ No newline at end of file
@@ -1,8 +1,12 @@
 """Paddle component for the pythonpaddle game."""
+import math
 import pygame
 from pythonpaddle.utils.config import CONFIG
 from pythonpaddle.core.physics import BallPhysics
 
+# Cosine of each whole degree, used for the AI's aiming error
+_COS360 = [math.cos(math.radians(i)) for i in range(360)]
+
 
 class Paddle:
     """Paddle class for player control."""
@@ -57,27 +61,31 @@ class Paddle:
             dt: Delta time for frame-rate independent movement
             ball: Ball object to track
         """
+        # Bind config values once for the rest of the update
+        height = CONFIG.WINDOW_HEIGHT
+        half_width = CONFIG.WINDOW_WIDTH >> 1
+        
         # Only update AI decision after reaction time has passed
         self.ai_think_timer += dt
         if self.ai_think_timer >= self.ai_reaction_time:
             self.ai_think_timer = 0
             
             # If ball is moving toward AI
-            if (self.position_x < CONFIG.WINDOW_WIDTH // 2 and ball.velocity_x < 0) or \
-               (self.position_x > CONFIG.WINDOW_WIDTH // 2 and ball.velocity_x > 0):
+            if (self.position_x < half_width and ball.velocity_x < 0) or \
+               (self.position_x > half_width and ball.velocity_x > 0):
                 
                 # Predict where the ball will be
                 predicted_y = BallPhysics.predict_ball_position(
-                    ball, self.ai_prediction_steps, CONFIG.WINDOW_HEIGHT)
+                    ball, self.ai_prediction_steps, height)
                 
                 # Add some intentional error to make AI beatable
-                error = pygame.math.Vector2(0, self.ai_error_margin).rotate(
-                    pygame.time.get_ticks() % 360).y
+                # (the y component of (0, margin) rotated by ticks % 360 degrees)
+                error = self.ai_error_margin * _COS360[pygame.time.get_ticks() % 360]
                 
                 self.ai_target_y = predicted_y + error
             else:
                 # Move toward center when ball is moving away
-                self.ai_target_y = CONFIG.WINDOW_HEIGHT // 2
+                self.ai_target_y = height // 2
         
         # Move toward the target position
         if self.position_y < self.ai_target_y - 5:
@@ -98,19 +106,24 @@ class Paddle:
         if self.is_ai and ball:
             self.update_ai(dt, ball)
         
+        # Bind values once for the rest of the update
+        window_height = CONFIG.WINDOW_HEIGHT
+        half_height = self.height // 2
+        
         # Update position with velocity
-        self.position_y += self.velocity * dt * 60
+        position_y = self.position_y + self.velocity * dt * 60
         
         # Constrain to screen bounds
-        if self.position_y - self.height // 2 < 0:
-            self.position_y = self.height // 2
+        if position_y - half_height < 0:
+            position_y = half_height
             self.velocity = 0
-        elif self.position_y + self.height // 2 > CONFIG.WINDOW_HEIGHT:
-            self.position_y = CONFIG.WINDOW_HEIGHT - self.height // 2
+        elif position_y + half_height > window_height:
+            position_y = window_height - half_height
             self.velocity = 0
         
         # Update the rect for rendering and collision detection
-        self.rect.y = self.position_y - self.height // 2
+        self.position_y = position_y
+        self.rect.y = position_y - half_height
     
     def render(self, screen):
         """
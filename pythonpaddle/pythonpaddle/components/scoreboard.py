@@ -1,6 +1,6 @@
 """Scoreboard component for tracking and displaying the score."""
-import pygame
 from pythonpaddle.utils.config import CONFIG
+from pythonpaddle.utils.fonts import get_font
 
 
 class Scoreboard:
@@ -10,7 +10,13 @@ class Scoreboard:
         """Initialize the scoreboard with default scores."""
         self.left_score = 0
         self.right_score = 0
-        self.font = pygame.font.Font(None, 74)
+        self.font = get_font(74)
+        
+        # Rendered score text and its blit position, keyed on the score value
+        self._left_cache = {}
+        self._right_cache = {}
+        self._left_center = (CONFIG.WINDOW_WIDTH // 4, 50)
+        self._right_center = (3 * CONFIG.WINDOW_WIDTH // 4, 50)
     
     def update_score(self, result):
         """
@@ -50,11 +56,30 @@ class Scoreboard:
             screen: pygame surface to render on
         """
         # Render left score
-        left_text = self.font.render(str(self.left_score), True, CONFIG.WHITE)
-        left_pos = (CONFIG.WINDOW_WIDTH // 4, 50)
-        screen.blit(left_text, left_text.get_rect(center=left_pos))
+        left_text, left_topleft = self._get_score_text(
+            self._left_cache, self.left_score, self._left_center)
+        screen.blit(left_text, left_topleft)
         
         # Render right score
-        right_text = self.font.render(str(self.right_score), True, CONFIG.WHITE)
-        right_pos = (3 * CONFIG.WINDOW_WIDTH // 4, 50)
-        screen.blit(right_text, right_text.get_rect(center=right_pos))
\ No newline at end of file
+        right_text, right_topleft = self._get_score_text(
+            self._right_cache, self.right_score, self._right_center)
+        screen.blit(right_text, right_topleft)
+    
+    def _get_score_text(self, cache, score, center):
+        """
+        Get the rendered text for a score, rendering it only the first time.
+        
+        Args:
+            cache: Dict of score to (surface, topleft) for one side
+            score: Score value to render
+            center: Center position of the text
+        
+        Returns:
+            tuple: (text surface, topleft position to blit it at)
+        """
+        cached = cache.get(score)
+        if cached is None:
+            text = self.font.render(str(score), True, CONFIG.WHITE).convert_alpha()
+            topleft = (center[0] - text.get_width() // 2, center[1] - text.get_height() // 2)
+            cached = cache[score] = (text, topleft)
+        return cached
\ No newline at end of file
@@ -0,0 +1,240 @@
+"""Broad-phase collision culling for the pythonpaddle game."""
+
+
+# How far, in pixels, each stored box extends past the real rect on every
+# side. Objects only need to be reinserted when they move outside their
+# fattened box, so this should cover several frames of movement.
+FAT_MARGIN = 8.0
+
+
+def _box(rect):
+    """Convert a rect into an (x0, y0, x1, y1) box."""
+    return (rect.x, rect.y, rect.x + rect.w, rect.y + rect.h)
+
+
+def _fatten(rect, margin):
+    """Convert a rect into a box enlarged by a margin on every side."""
+    return (rect.x - margin, rect.y - margin,
+            rect.x + rect.w + margin, rect.y + rect.h + margin)
+
+
+def _union(a, b):
+    """Return the smallest box containing both boxes."""
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def _perimeter(box):
+    """Return the perimeter of a box, used as the insertion cost."""
+    return 2 * ((box[2] - box[0]) + (box[3] - box[1]))
+
+
+def _contains(outer, inner):
+    """Check if a box fully contains another box."""
+    return (outer[0] <= inner[0] and outer[1] <= inner[1] and
+            outer[2] >= inner[2] and outer[3] >= inner[3])
+
+
+def _overlaps(a, b):
+    """Check if two boxes overlap."""
+    return a[0] < b[2] and a[2] > b[0] and a[1] < b[3] and a[3] > b[1]
+
+
+class _Node:
+    """A node of the AABB tree. Leaves hold an item, branches hold two children."""
+    
+    __slots__ = ("box", "item", "parent", "left", "right")
+    
+    def __init__(self, box, item=None):
+        self.box = box
+        self.item = item
+        self.parent = None
+        self.left = None
+        self.right = None
+    
+    @property
+    def is_leaf(self):
+        """True if this node holds an item rather than children."""
+        return self.left is None
+
+
+class AABBTree:
+    """
+    Dynamic bounding volume hierarchy of axis-aligned boxes.
+    
+    Used to cull collision pairs before the exact per-pair test, so lookups
+    stay O(log n) as the number of balls and paddles grows.
+    """
+    
+    def __init__(self, margin=FAT_MARGIN):
+        """
+        Initialize an empty tree.
+        
+        Args:
+            margin: Pixels each stored box extends past its rect on every side
+        """
+        self.margin = margin
+        self.root = None
+        self._leaves = {}
+    
+    def __len__(self):
+        return len(self._leaves)
+    
+    def __contains__(self, item):
+        return item in self._leaves
+    
+    def insert(self, item, rect):
+        """
+        Add an item to the tree.
+        
+        Args:
+            item: Object to store (e.g. a paddle)
+            rect: pygame Rect bounding the item
+        """
+        leaf = _Node(_fatten(rect, self.margin), item)
+        self._leaves[item] = leaf
+        self._insert_leaf(leaf)
+    
+    def update(self, item, rect):
+        """
+        Move an item, inserting it if it is not in the tree yet.
+        
+        Args:
+            item: Object stored in the tree
+            rect: pygame Rect bounding the item
+        
+        Returns:
+            bool: True if the item was (re)inserted, False if it is still
+                inside its fattened box
+        """
+        leaf = self._leaves.get(item)
+        if leaf is None:
+            self.insert(item, rect)
+            return True
+        
+        if _contains(leaf.box, _box(rect)):
+            return False
+        
+        self._remove_leaf(leaf)
+        leaf.box = _fatten(rect, self.margin)
+        self._insert_leaf(leaf)
+        return True
+    
+    def remove(self, item):
+        """
+        Remove an item from the tree.
+        
+        Args:
+            item: Object stored in the tree
+        """
+        self._remove_leaf(self._leaves.pop(item))
+    
+    def query(self, rect):
+        """
+        Find the items whose boxes overlap a rect.
+        
+        Args:
+            rect: pygame Rect to test against
+        
+        Returns:
+            list: Candidate items; run the exact collision test on each
+        """
+        return self.query_box(_box(rect))
+    
+    def query_box(self, box):
+        """
+        Find the items whose boxes overlap an (x0, y0, x1, y1) box.
+        
+        Args:
+            box: Tuple of left, top, right and bottom edges
+        
+        Returns:
+            list: Candidate items; run the exact collision test on each
+        """
+        results = []
+        if self.root is None:
+            return results
+        
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if not _overlaps(node.box, box):
+                continue
+            if node.is_leaf:
+                results.append(node.item)
+            else:
+                stack.append(node.left)
+                stack.append(node.right)
+        return results
+    
+    def _insert_leaf(self, leaf):
+        """Insert a leaf next to the sibling that grows the tree the least."""
+        if self.root is None:
+            self.root = leaf
+            leaf.parent = None
+            return
+        
+        # Walk down, picking the cheapest child until stopping here is cheaper
+        node = self.root
+        while not node.is_leaf:
+            combined = _perimeter(_union(node.box, leaf.box))
+            cost = 2 * combined
+            inherited = 2 * (combined - _perimeter(node.box))
+            
+            child_costs = []
+            for child in (node.left, node.right):
+                child_cost = _perimeter(_union(child.box, leaf.box)) + inherited
+                if not child.is_leaf:
+                    child_cost -= _perimeter(child.box)
+                child_costs.append(child_cost)
+            
+            if cost < child_costs[0] and cost < child_costs[1]:
+                break
+            node = node.left if child_costs[0] < child_costs[1] else node.right
+        
+        # Replace the sibling with a new branch holding the sibling and the leaf
+        sibling = node
+        old_parent = sibling.parent
+        new_parent = _Node(_union(sibling.box, leaf.box))
+        new_parent.parent = old_parent
+        new_parent.left = sibling
+        new_parent.right = leaf
+        sibling.parent = new_parent
+        leaf.parent = new_parent
+        
+        if old_parent is None:
+            self.root = new_parent
+        elif old_parent.left is sibling:
+            old_parent.left = new_parent
+        else:
+            old_parent.right = new_parent
+        
+        self._refit(old_parent)
+    
+    def _remove_leaf(self, leaf):
+        """Detach a leaf, promoting its sibling into the parent's place."""
+        if leaf is self.root:
+            self.root = None
+            return
+        
+        parent = leaf.parent
+        grandparent = parent.parent
+        sibling = parent.right if parent.left is leaf else parent.left
+        
+        if grandparent is None:
+            self.root = sibling
+            sibling.parent = None
+        else:
+            if grandparent.left is parent:
+                grandparent.left = sibling
+            else:
+                grandparent.right = sibling
+            sibling.parent = grandparent
+            self._refit(grandparent)
+        
+        leaf.parent = None
+    
+    def _refit(self, node):
+        """Recompute branch boxes from a node up to the root."""
+        while node is not None:
+            node.box = _union(node.left.box, node.right.box)
+            node = node.parent
@@ -1,6 +1,7 @@
 """Core game engine implementing game loop and state management."""
 import pygame
 import sys
+import threading
 import time
 from pythonpaddle.utils.config import CONFIG
 from pythonpaddle.states.state_machine import StateMachine
@@ -24,6 +25,28 @@ class GameEngine:
         self.last_time = time.time()
         self.frame_count = 0
         self.fps_timer = 0
+        self._inv_1000 = 1.0 / 1000.0  # Clock ticks are in milliseconds
+        
+        # Double-buffered frame handoff to the render thread. The main thread
+        # draws into _buffers[_write_index]; the render thread blits the
+        # buffer at _ready_index to the screen and flips. A buffer is never
+        # drawn into while the render thread is presenting it.
+        # Off by default: SDL's video calls are only safe on the main thread
+        # on some platforms (e.g. macOS).
+        self._buffers = None
+        self._write_index = 0
+        self._ready_index = None
+        self._presenting_index = None
+        self._stop_render = False
+        self._buffer_cond = threading.Condition(threading.Lock())
+        self._render_thread = None
+        if CONFIG.THREADED_RENDER:
+            self._buffers = [
+                pygame.Surface((CONFIG.WINDOW_WIDTH, CONFIG.WINDOW_HEIGHT)).convert()
+                for _ in range(2)
+            ]
+            self._render_thread = threading.Thread(target=self._present_loop, daemon=True)
+            self._render_thread.start()
         
         # Initialize the state machine
         self.state_machine = StateMachine()
@@ -51,7 +74,8 @@ class GameEngine:
             while self.running:
                 # Calculate delta time for frame-rate independent movement
                 # Cap dt to avoid physics bugs on slow machines or when window is dragged
-                dt = min(self.clock.tick(CONFIG.FPS) / 1000.0, 0.1)
+                dt_raw = self.clock.tick(CONFIG.FPS) * self._inv_1000
+                dt = 0.1 if dt_raw > 0.1 else dt_raw
                 
                 # Performance monitoring
                 self.frame_count += 1
@@ -60,13 +84,26 @@ class GameEngine:
                     self.fps_timer = 0
                     self.frame_count = 0
                 
-                # Process input
+                # Process input: drain the whole queue in one batch per frame
+                # (event.get() pumps SDL once) and dispatch locally
                 try:
-                    events = pygame.event.get()
+                    current = self.state_machine.current
+                    if current is not None and current.wait_for_event:
+                        # Idle states sleep until input arrives or a frame passes
+                        event = pygame.event.wait(timeout=16)
+                        events = pygame.event.get()
+                        if event.type != pygame.NOEVENT:
+                            events.insert(0, event)
+                    else:
+                        events = pygame.event.get()
+                    handle_event = self.state_machine.handle_event
                     for event in events:
                         if event.type == pygame.QUIT:
                             self.running = False
-                        self.state_machine.handle_event(event)
+                        elif event.type == pygame.VIDEOEXPOSE and self.state_machine.current:
+                            # The window needs repainting even if nothing changed
+                            self.state_machine.current.dirty = True
+                        handle_event(event)
                 except Exception as e:
                     print(f"Event handling error: {e}")
                     continue  # Skip this frame but continue game
@@ -78,11 +115,21 @@ class GameEngine:
                     print(f"Update error: {e}")
                     continue  # Skip this frame but continue game
                 
-                # Render
+                # Render, skipping frames where the current state has nothing new to draw
                 try:
-                    self.screen.fill(CONFIG.BLACK)
-                    self.state_machine.render(self.screen)
-                    pygame.display.flip()
+                    current = self.state_machine.current
+                    if current is not None and not current.dirty:
+                        continue
+                    
+                    # States clear the frame themselves, so there is no fill here
+                    if self._render_thread:
+                        self._render_to_back_buffer()
+                    else:
+                        self.state_machine.render(self.screen)
+                        pygame.display.flip()
+                    
+                    if current is not None:
+                        current.dirty = False
                 except Exception as e:
                     print(f"Render error: {e}")
                     continue  # Skip this frame but continue game
@@ -97,10 +144,65 @@ class GameEngine:
         """Set the running flag to False to exit the game loop."""
         self.running = False
     
+    def _render_to_back_buffer(self):
+        """Render the current state into a free back-buffer and hand it off."""
+        with self._buffer_cond:
+            while self._presenting_index == self._write_index:
+                self._buffer_cond.wait()
+            back_buffer = self._buffers[self._write_index]
+        
+        self.state_machine.render(back_buffer)
+        
+        with self._buffer_cond:
+            self._ready_index = self._write_index
+            self._write_index = 1 - self._write_index
+            self._buffer_cond.notify_all()
+    
+    def _present_loop(self):
+        """Present finished back-buffers to the display (runs on the render thread)."""
+        while True:
+            with self._buffer_cond:
+                while self._ready_index is None and not self._stop_render:
+                    self._buffer_cond.wait()
+                if self._stop_render:
+                    return
+                index = self._presenting_index = self._ready_index
+                self._ready_index = None
+            
+            try:
+                self.screen.blit(self._buffers[index], (0, 0))
+                pygame.display.flip()
+            except Exception as e:
+                print(f"Render error: {e}")
+            
+            with self._buffer_cond:
+                self._presenting_index = None
+                self._buffer_cond.notify_all()
+    
+    def _stop_render_thread(self):
+        """
+        Stop the render thread and wait for it to finish.
+        
+        Returns:
+            bool: True if no render thread is left running
+        """
+        if self._render_thread:
+            with self._buffer_cond:
+                self._stop_render = True
+                self._buffer_cond.notify_all()
+            self._render_thread.join(timeout=1.0)
+            if self._render_thread.is_alive():
+                return False
+            self._render_thread = None
+        return True
+    
     def _cleanup(self):
         """Clean up resources before exiting."""
-        try:
-            pygame.quit()
-        except:
-            pass
+        # Never tear SDL down while the render thread may still be inside
+        # flip(); process exit releases everything in that case
+        if self._stop_render_thread():
+            try:
+                pygame.quit()
+            except:
+                pass
         sys.exit()
\ No newline at end of file
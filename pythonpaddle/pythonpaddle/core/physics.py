@@ -3,6 +3,108 @@ import math
 import random
 from pythonpaddle.utils.config import CONFIG
 
+# Numba is optional; without it the numeric kernels below run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _predict(pos_y, vel_y, steps, window_height):
+    """
+    Predict the ball's y position, bouncing off the top and bottom walls.
+    
+    With constant velocity the bounces trace a triangle wave, so the
+    position is found by unfolding the wall reflections in O(1).
+    
+    Args:
+        pos_y: Starting y position
+        vel_y: y velocity per step
+        steps: Number of steps to predict ahead
+        window_height: Height of the game window
+        
+    Returns:
+        float: Predicted y position
+    """
+    total_y = pos_y + vel_y * steps
+    period = 2 * window_height
+    folded = total_y % period
+    return folded if folded <= window_height else period - folded
+
+
+def _wall_bounce(velocity_y, min_speed_y):
+    """
+    Reverse the y velocity with a slight randomization after a wall hit.
+    
+    Args:
+        velocity_y: Current y velocity
+        min_speed_y: Smallest allowed y speed after the bounce
+        
+    Returns:
+        float: New y velocity
+    """
+    result = -velocity_y * random.uniform(0.95, 1.05)
+    
+    # Ensure velocity isn't too low
+    if abs(result) < min_speed_y:
+        result = math.copysign(min_speed_y, result)
+    
+    return result
+
+
+def _step_ball(pos_x, pos_y, vel_x, vel_y, dt_times_60, size, window_height, min_speed_y):
+    """
+    Move the ball one frame and bounce it off the top and bottom walls.
+    
+    Args:
+        pos_x: Current x position
+        pos_y: Current y position
+        vel_x: Current x velocity
+        vel_y: Current y velocity
+        dt_times_60: Delta time scaled to 60 FPS frames
+        size: Size of the ball
+        window_height: Height of the game window
+        min_speed_y: Smallest allowed y speed after a wall bounce
+        
+    Returns:
+        tuple: (new_pos_x, new_pos_y, new_vel_y, hit_wall)
+    """
+    pos_x += vel_x * dt_times_60
+    pos_y += vel_y * dt_times_60
+    
+    half_size = size // 2
+    top = pos_y - half_size
+    hit_wall = top <= 0 or top + size >= window_height
+    if hit_wall:
+        vel_y = _wall_bounce(vel_y, min_speed_y)
+        # Ensure ball stays in bounds
+        if top < 0:
+            pos_y = half_size
+        elif top + size > window_height:
+            pos_y = window_height - size + half_size
+    
+    return pos_x, pos_y, vel_y, hit_wall
+
+
+if njit is not None:
+    # Cache the compiled artifacts on disk to avoid recompiling on every launch
+    _predict = njit(cache=True, fastmath=True)(_predict)
+    _wall_bounce = njit(cache=True)(_wall_bounce)
+    _step_ball = njit(cache=True)(_step_ball)
+    
+    # Warm up the kernels at import so the first frame and the AI's first
+    # prediction don't stall on compiling or loading the cache
+    _step_ball(0.0, 0.0, 0.0, 0.0, 0.0, 1, 1, 0.0)
+    _predict(0.0, 0.0, 1, 1)
+
+# Lookup tables for bounce angles between -45 and 45 degrees, quantized into
+# _ANGLE_STEPS steps either side of zero. Index with step + _ANGLE_STEPS.
+_ANGLE_STEPS = 64
+_COS_TABLE = [math.cos(i / _ANGLE_STEPS * math.pi / 4)
+              for i in range(-_ANGLE_STEPS, _ANGLE_STEPS + 1)]
+_SIN_TABLE = [math.sin(i / _ANGLE_STEPS * math.pi / 4)
+              for i in range(-_ANGLE_STEPS, _ANGLE_STEPS + 1)]
+
 
 class BallPhysics:
     """Handles physics calculations for the ball."""
@@ -23,17 +125,19 @@ class BallPhysics:
         try:
             # Calculate where the ball hit the paddle (normalized from -1 to 1)
             # -1 means hitting the top of the paddle, 1 means hitting the bottom
-            relative_intersect_y = (paddle.rect.centery - ball.rect.centery)
+            relative_intersect_y = (paddle.rect.centery - ball.position_y)
             normalized_intersect_y = relative_intersect_y / (paddle.rect.height / 2)
             # Clamp the value between -1 and 1
             normalized_intersect_y = max(-1.0, min(1.0, normalized_intersect_y))
             
-            # Calculate bounce angle based on where the ball hit the paddle
-            # The angle will be between -45 and 45 degrees (in radians)
-            bounce_angle = normalized_intersect_y * (math.pi / 4)
+            # Look up the bounce angle based on where the ball hit the paddle
+            # The angle will be between -45 and 45 degrees
+            idx = int(round(normalized_intersect_y * _ANGLE_STEPS)) + _ANGLE_STEPS
+            cos_a = _COS_TABLE[idx]
+            sin_a = _SIN_TABLE[idx]
             
             # Calculate current speed of the ball
-            current_speed = math.sqrt(ball.velocity_x**2 + ball.velocity_y**2)
+            current_speed = math.hypot(ball.velocity_x, ball.velocity_y)
             
             # Increase speed slightly with each paddle hit
             new_speed = current_speed + CONFIG.BALL_SPEED_INCREASE
@@ -41,8 +145,8 @@ class BallPhysics:
             
             # Calculate new velocity components
             direction = 1 if is_left_paddle else -1
-            new_velocity_x = direction * new_speed * math.cos(bounce_angle)
-            new_velocity_y = -new_speed * math.sin(bounce_angle)
+            new_velocity_x = direction * new_speed * cos_a
+            new_velocity_y = -new_speed * sin_a
             
             # Safety check for NaN or infinity values
             if math.isnan(new_velocity_x) or math.isinf(new_velocity_x) or \
@@ -60,29 +164,23 @@ class BallPhysics:
             return direction * CONFIG.BALL_SPEED_X, random.uniform(-0.5, 0.5) * CONFIG.BALL_SPEED_Y
     
     @staticmethod
-    def calculate_wall_collision(velocity_y):
+    def step_ball(ball, dt, window_height):
         """
-        Calculate new velocity after a wall (top/bottom) collision.
+        Move the ball one frame and resolve top and bottom wall bounces.
         
         Args:
-            velocity_y: Current y velocity
+            ball: The ball object (read only; the caller applies the results)
+            dt: Delta time for frame-rate independent physics
+            window_height: Height of the game window
             
         Returns:
-            float: New y velocity
+            tuple: (new_position_x, new_position_y, new_velocity_y, hit_wall)
         """
-        # Simply reverse the y velocity with a slight randomization
-        try:
-            randomization = random.uniform(0.95, 1.05)
-            result = -velocity_y * randomization
-            
-            # Ensure velocity isn't too low
-            if abs(result) < CONFIG.BALL_SPEED_Y * 0.5:
-                result = math.copysign(CONFIG.BALL_SPEED_Y * 0.5, result)
-            
-            return result
-        except:
-            # Safe fallback
-            return -velocity_y
+        return _step_ball(
+            float(ball.position_x), float(ball.position_y),
+            float(ball.velocity_x), float(ball.velocity_y),
+            dt * 60, ball.size, window_height, CONFIG.BALL_SPEED_Y * 0.5
+        )
     
     @staticmethod
     def generate_initial_velocity():
@@ -93,15 +191,15 @@ class BallPhysics:
             tuple: (velocity_x, velocity_y)
         """
         try:
-            # Generate a random angle between -45 and 45 degrees (in radians)
-            angle = random.uniform(-math.pi/4, math.pi/4)
+            # Pick a random angle between -45 and 45 degrees from the tables
+            idx = random.randint(-_ANGLE_STEPS, _ANGLE_STEPS) + _ANGLE_STEPS
             
             # Randomly choose the horizontal direction
             direction = random.choice([-1, 1])
             
             # Calculate velocity components
-            velocity_x = direction * CONFIG.BALL_SPEED_X * math.cos(angle)
-            velocity_y = CONFIG.BALL_SPEED_Y * math.sin(angle)
+            velocity_x = direction * CONFIG.BALL_SPEED_X * _COS_TABLE[idx]
+            velocity_y = CONFIG.BALL_SPEED_Y * _SIN_TABLE[idx]
             
             return velocity_x, velocity_y
         except:
@@ -153,88 +251,13 @@ class BallPhysics:
         try:
             # Simple prediction that ignores paddle collisions
             # but accounts for wall bounces
-            pos_x = ball.position_x
-            pos_y = ball.position_y
-            vel_x = ball.velocity_x
-            vel_y = ball.velocity_y
-            
             # Limit time_steps for safer predictions
             actual_steps = min(time_steps, 30)
             
-            # Simulate movement
-            for _ in range(actual_steps):
-                pos_x += vel_x
-                pos_y += vel_y
-                
-                # Check for wall collisions
-                if pos_y <= 0 or pos_y >= window_height:
-                    vel_y = -vel_y
-                    pos_y = max(0, min(window_height, pos_y))
-            
-            return pos_y
+            return _predict(
+                float(ball.position_y), float(ball.velocity_y),
+                actual_steps, window_height
+            )
         except:
             # Safe fallback - return center of screen
             return window_height // 2
-
-
-class CollisionDetector:
-    """Handles collision detection between game objects."""
-    
-    @staticmethod
-    def check_ball_paddle_collision(ball, paddle):
-        """
-        Check if the ball is colliding with a paddle.
-        
-        Args:
-            ball: The ball object
-            paddle: The paddle object
-            
-        Returns:
-            bool: True if collision detected, False otherwise
-        """
-        try:
-            return ball.rect.colliderect(paddle.rect)
-        except:
-            # In case of error, assume no collision
-            return False
-    
-    @staticmethod
-    def check_ball_wall_collision(ball, window_height):
-        """
-        Check if the ball is colliding with the top or bottom wall.
-        
-        Args:
-            ball: The ball object
-            window_height: Height of the game window
-            
-        Returns:
-            bool: True if collision detected, False otherwise
-        """
-        try:
-            return ball.rect.top <= 0 or ball.rect.bottom >= window_height
-        except:
-            # In case of error, assume no collision
-            return False
-    
-    @staticmethod
-    def check_ball_goal_collision(ball, window_width):
-        """
-        Check if the ball has entered a goal area (left or right edge).
-        
-        Args:
-            ball: The ball object
-            window_width: Width of the game window
-            
-        Returns:
-            int: 1 if right player scored, -1 if left player scored, 0 otherwise
-        """
-        try:
-            if ball.rect.right >= window_width:
-                return -1  # Left player scored
-            elif ball.rect.left <= 0:
-                return 1  # Right player scored
-            else:
-                return 0  # No goal
-        except:
-            # In case of error, assume no scoring
-            return 0
\ No newline at end of file
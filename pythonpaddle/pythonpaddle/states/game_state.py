@@ -1,10 +1,22 @@
 """Game state for the pythonpaddle game."""
 import pygame
-from pythonpaddle.utils.config import CONFIG
+from pythonpaddle.utils.config import CONFIG, BLACK, WHITE, YELLOW, WINDOW_WIDTH, WINDOW_HEIGHT
 from pythonpaddle.components.ball import Ball
 from pythonpaddle.components.paddle import Paddle
 from pythonpaddle.components.scoreboard import Scoreboard
-from pythonpaddle.utils.sound_manager import SoundManager
+from pythonpaddle.core.broadphase import AABBTree
+from pythonpaddle.utils.fonts import get_font
+
+# pygame names used every frame, bound once to skip the module attribute lookup
+_get_pressed = pygame.key.get_pressed
+_KEYDOWN = pygame.KEYDOWN
+_K_ESCAPE = pygame.K_ESCAPE
+_K_p = pygame.K_p
+_K_r = pygame.K_r
+_K_w = pygame.K_w
+_K_s = pygame.K_s
+_K_UP = pygame.K_UP
+_K_DOWN = pygame.K_DOWN
 
 
 class GameState:
@@ -20,23 +32,77 @@ class GameState:
         """
         self.engine = engine
         self.is_ai_opponent = is_ai_opponent
-        self.sound_manager = SoundManager()
-        self.sound_manager.load_sounds()
+        
+        # Fixed screen geometry, computed once
+        self._cx = WINDOW_WIDTH // 2
+        self._center_top = (self._cx, 0)
+        self._center_bot = (self._cx, WINDOW_HEIGHT)
+        self._mid = (self._cx, WINDOW_HEIGHT // 2)
+        self._mid_below = (self._cx, WINDOW_HEIGHT // 2 + 50)
+        self._left_paddle_x = CONFIG.PADDLE_MARGIN
+        self._right_paddle_x = WINDOW_WIDTH - CONFIG.PADDLE_MARGIN
+        
+        # Static background (black with the center line), blitted as the frame clear
+        self._background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self._background.fill(BLACK)
+        pygame.draw.aaline(self._background, WHITE, self._center_top, self._center_bot)
+        
+        # Pre-render the overlay messages once instead of every frame
+        self._large_font = get_font(74)
+        self._small_font = get_font(36)
+        self._pause_text = self._render_text(self._large_font, "PAUSED", YELLOW, self._mid)
+        self._pause_hint = self._render_text(
+            self._small_font, "Press P to resume, ESC for menu", WHITE, self._mid_below)
+        
+        right_winner_text = "AI Wins!" if is_ai_opponent else "Player 2 Wins!"
+        self._winner_texts = {
+            "left": self._render_text(self._large_font, "Player 1 Wins!", YELLOW, self._mid),
+            "right": self._render_text(self._large_font, right_winner_text, YELLOW, self._mid)
+        }
+        self._game_over_hint = self._render_text(
+            self._small_font, "Press R to restart, ESC for menu", WHITE, self._mid_below)
+        
         self.reset()
     
+    @staticmethod
+    def _render_text(font, text, color, center):
+        """
+        Render a line of text centered on a position.
+        
+        Args:
+            font: pygame font to render with
+            text: Text to render
+            color: Text color
+            center: Center position of the text
+        
+        Returns:
+            tuple: (text surface, rect to blit it at)
+        """
+        surface = font.render(text, True, color).convert_alpha()
+        return surface, surface.get_rect(center=center)
+    
+    @property
+    def wait_for_event(self):
+        """Whether the engine should block waiting for input (nothing moves while paused or over)."""
+        return self.paused or self.game_over
+    
     def reset(self):
         """Reset the game state to initial conditions."""
         # Create game objects
         self.ball = Ball()
         
         # Create paddles
-        left_paddle_x = CONFIG.PADDLE_MARGIN
-        right_paddle_x = CONFIG.WINDOW_WIDTH - CONFIG.PADDLE_MARGIN
+        self.left_paddle = Paddle(self._left_paddle_x)
+        self.right_paddle = Paddle(self._right_paddle_x, is_ai=self.is_ai_opponent)
         
-        self.left_paddle = Paddle(left_paddle_x)
-        self.right_paddle = Paddle(right_paddle_x, is_ai=self.is_ai_opponent)
+        self.paddles = (self.left_paddle, self.right_paddle)
         
-        self.paddles = [self.left_paddle, self.right_paddle]
+        # Broad-phase index of the paddles, shared by every ball. A fresh tree
+        # drops the previous paddles. The margin covers several frames of
+        # paddle movement so a moving paddle is rarely reinserted.
+        self.paddle_tree = AABBTree(margin=CONFIG.PADDLE_SPEED * 8)
+        for paddle in self.paddles:
+            self.paddle_tree.insert(paddle, paddle.rect)
         
         # Create scoreboard
         self.scoreboard = Scoreboard()
@@ -45,6 +111,9 @@ class GameState:
         self.paused = False
         self.game_over = False
         self.winner = None
+        
+        # Whether anything changed since the last render
+        self.dirty = True
     
     def enter(self):
         """Called when entering this state."""
@@ -61,33 +130,14 @@ class GameState:
         Args:
             event: pygame event to process
         """
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
+        if event.type == _KEYDOWN:
+            self.dirty = True
+            if event.key == _K_ESCAPE:
                 self.engine.state_machine.change("menu")
-            elif event.key == pygame.K_p:
+            elif event.key == _K_p:
                 self.paused = not self.paused
-            elif event.key == pygame.K_r:
+            elif event.key == _K_r:
                 self.reset()
-        
-        # Player control handling
-        keys = pygame.key.get_pressed()
-        
-        # Left paddle controls
-        if keys[pygame.K_w]:
-            self.left_paddle.move_up()
-        elif keys[pygame.K_s]:
-            self.left_paddle.move_down()
-        else:
-            self.left_paddle.stop()
-        
-        # Right paddle controls (only if not AI)
-        if not self.is_ai_opponent:
-            if keys[pygame.K_UP]:
-                self.right_paddle.move_up()
-            elif keys[pygame.K_DOWN]:
-                self.right_paddle.move_down()
-            else:
-                self.right_paddle.stop()
     
     def update(self, dt):
         """
@@ -99,12 +149,33 @@ class GameState:
         if self.paused or self.game_over:
             return
         
+        # The ball is always moving during play
+        self.dirty = True
+        
+        # Player control handling, polled once per frame
+        keys = _get_pressed()
+        
+        # Left paddle controls (direction is -1 up, 1 down, 0 for none or both)
+        left_paddle = self.left_paddle
+        left_paddle.velocity = (keys[_K_s] - keys[_K_w]) * left_paddle.speed
+        
+        # Right paddle controls (only if not AI)
+        if not self.is_ai_opponent:
+            right_paddle = self.right_paddle
+            right_paddle.velocity = (keys[_K_DOWN] - keys[_K_UP]) * right_paddle.speed
+        
         # Update paddles
         self.left_paddle.update(dt)
         self.right_paddle.update(dt, self.ball if self.is_ai_opponent else None)
         
+        # Sync the broad phase once per paddle; a paddle is only reinserted
+        # once it leaves its fattened box
+        paddle_tree = self.paddle_tree
+        for paddle in self.paddles:
+            paddle_tree.update(paddle, paddle.rect)
+        
         # Update ball and check for scoring
-        score_result = self.ball.update(dt, self.paddles)
+        score_result = self.ball.update(dt, paddle_tree)
         if score_result != 0:
             self.scoreboard.update_score(score_result)
             
@@ -121,13 +192,8 @@ class GameState:
         Args:
             screen: pygame surface to render on
         """
-        # Draw the center line
-        pygame.draw.aaline(
-            screen,
-            CONFIG.WHITE,
-            (CONFIG.WINDOW_WIDTH // 2, 0),
-            (CONFIG.WINDOW_WIDTH // 2, CONFIG.WINDOW_HEIGHT)
-        )
+        # Draw the background with the center line
+        screen.blit(self._background, (0, 0))
         
         # Render game objects
         self.ball.render(screen)
@@ -137,28 +203,10 @@ class GameState:
         
         # Display pause message if paused
         if self.paused:
-            font = pygame.font.Font(None, 74)
-            text = font.render("PAUSED", True, CONFIG.YELLOW)
-            text_rect = text.get_rect(center=(CONFIG.WINDOW_WIDTH // 2, CONFIG.WINDOW_HEIGHT // 2))
-            screen.blit(text, text_rect)
-            
-            small_font = pygame.font.Font(None, 36)
-            hint_text = small_font.render("Press P to resume, ESC for menu", True, CONFIG.WHITE)
-            hint_rect = hint_text.get_rect(center=(CONFIG.WINDOW_WIDTH // 2, CONFIG.WINDOW_HEIGHT // 2 + 50))
-            screen.blit(hint_text, hint_rect)
+            screen.blit(*self._pause_text)
+            screen.blit(*self._pause_hint)
         
         # Display game over message
         if self.game_over:
-            font = pygame.font.Font(None, 74)
-            winner_text = "Player 1 Wins!" if self.winner == "left" else "Player 2 Wins!"
-            if self.winner == "right" and self.is_ai_opponent:
-                winner_text = "AI Wins!"
-            
-            text = font.render(winner_text, True, CONFIG.YELLOW)
-            text_rect = text.get_rect(center=(CONFIG.WINDOW_WIDTH // 2, CONFIG.WINDOW_HEIGHT // 2))
-            screen.blit(text, text_rect)
-            
-            small_font = pygame.font.Font(None, 36)
-            hint_text = small_font.render("Press R to restart, ESC for menu", True, CONFIG.WHITE)
-            hint_rect = hint_text.get_rect(center=(CONFIG.WINDOW_WIDTH // 2, CONFIG.WINDOW_HEIGHT // 2 + 50))
-            screen.blit(hint_text, hint_rect)
\ No newline at end of file
+            screen.blit(*self._winner_texts[self.winner])
+            screen.blit(*self._game_over_hint)
\ No newline at end of file
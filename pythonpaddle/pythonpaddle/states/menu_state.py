@@ -1,11 +1,15 @@
 """Menu state for the pythonpaddle game."""
 import pygame
-from pythonpaddle.utils.config import CONFIG
+from pythonpaddle.utils.config import BLACK, WHITE, YELLOW, WINDOW_WIDTH, WINDOW_HEIGHT
+from pythonpaddle.utils.fonts import get_font
 
 
 class MenuState:
     """Menu state handling the main menu screen."""
     
+    # Whether the engine should block waiting for input while this state is active
+    wait_for_event = True
+    
     def __init__(self, engine):
         """
         Initialize the menu state.
@@ -14,23 +18,43 @@ class MenuState:
             engine: Reference to the main game engine
         """
         self.engine = engine
-        self.title_font = pygame.font.Font(None, 100)
-        self.menu_font = pygame.font.Font(None, 36)
+        self.title_font = get_font(100)
+        self.menu_font = get_font(36)
         
-        self.title_text = self.title_font.render("PythonPaddle", True, CONFIG.WHITE)
-        self.title_rect = self.title_text.get_rect(center=(CONFIG.WINDOW_WIDTH // 2, CONFIG.WINDOW_HEIGHT // 4))
+        self.title_text = self.title_font.render("PythonPaddle", True, WHITE).convert_alpha()
+        self.title_rect = self.title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 4))
         
-        self.options = [
-            {"text": "Single Player", "action": "game_ai"},
-            {"text": "Two Players", "action": "game_2p"},
-            {"text": "Exit", "action": "quit"}
-        ]
+        # (text, action) pairs; the action runs when the option is selected with ENTER
+        self.options = (
+            ("Single Player", lambda: engine.state_machine.change("game_ai")),
+            ("Two Players", lambda: engine.state_machine.change("game_2p")),
+            ("Exit", engine.quit)
+        )
         
         self.selected_option = 0
+        
+        # Whether anything changed since the last render
+        self.dirty = True
+        
+        # Pre-render each option in both colors (normal, selected), plus the instructions
+        self._option_surfs = [
+            (self.menu_font.render(text, True, WHITE).convert_alpha(),
+             self.menu_font.render(text, True, YELLOW).convert_alpha())
+            for text, _ in self.options
+        ]
+        self._option_rects = [
+            surfs[0].get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + i * 50))
+            for i, surfs in enumerate(self._option_surfs)
+        ]
+        
+        self._instructions_surf = self.menu_font.render(
+            "Use UP/DOWN arrows and ENTER to select", True, WHITE).convert_alpha()
+        self._instructions_rect = self._instructions_surf.get_rect(
+            center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT * 0.8))
     
     def enter(self):
         """Called when entering this state."""
-        pass
+        self.dirty = True
     
     def exit(self):
         """Called when exiting this state."""
@@ -44,16 +68,13 @@ class MenuState:
             event: pygame event to process
         """
         if event.type == pygame.KEYDOWN:
+            self.dirty = True
             if event.key == pygame.K_UP:
                 self.selected_option = (self.selected_option - 1) % len(self.options)
             elif event.key == pygame.K_DOWN:
                 self.selected_option = (self.selected_option + 1) % len(self.options)
             elif event.key == pygame.K_RETURN:
-                action = self.options[self.selected_option]["action"]
-                if action == "quit":
-                    self.engine.quit()
-                else:
-                    self.engine.state_machine.change(action)
+                self.options[self.selected_option][1]()
     
     def update(self, dt):
         """
@@ -71,17 +92,15 @@ class MenuState:
         Args:
             screen: pygame surface to render on
         """
+        # Clear the frame (each state owns its own clear)
+        screen.fill(BLACK)
+        
         # Draw title
         screen.blit(self.title_text, self.title_rect)
         
         # Draw menu options
-        for i, option in enumerate(self.options):
-            text_color = CONFIG.YELLOW if i == self.selected_option else CONFIG.WHITE
-            text = self.menu_font.render(option["text"], True, text_color)
-            rect = text.get_rect(center=(CONFIG.WINDOW_WIDTH // 2, CONFIG.WINDOW_HEIGHT // 2 + i * 50))
-            screen.blit(text, rect)
+        for i, surfs in enumerate(self._option_surfs):
+            screen.blit(surfs[1 if i == self.selected_option else 0], self._option_rects[i])
         
         # Draw instructions
-        instructions_text = self.menu_font.render("Use UP/DOWN arrows and ENTER to select", True, CONFIG.WHITE)
-        instructions_rect = instructions_text.get_rect(center=(CONFIG.WINDOW_WIDTH // 2, CONFIG.WINDOW_HEIGHT * 0.8))
-        screen.blit(instructions_text, instructions_rect)
\ No newline at end of file
+        screen.blit(self._instructions_surf, self._instructions_rect)
\ No newline at end of file
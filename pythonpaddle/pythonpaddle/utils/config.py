@@ -2,7 +2,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GameConfiguration:
     """Game configuration parameters."""
     # Window settings
@@ -34,8 +34,19 @@ class GameConfiguration:
     
     # Sound settings
     SOUND_ENABLED: bool = True
-    SOUND_VOLUME: float = 0.7
+    SOUND_VOLUME: float = 1.0  # Master scale for the per-sound volumes in SoundManager
+    
+    # Performance settings
+    THREADED_RENDER: bool = False  # Present frames from a separate thread (not safe on macOS)
 
 
 # Global instance
-CONFIG = GameConfiguration()
\ No newline at end of file
+CONFIG = GameConfiguration()
+
+# Module-level aliases for values read on hot paths, so callers can import
+# them directly instead of going through CONFIG each time
+WINDOW_WIDTH = CONFIG.WINDOW_WIDTH
+WINDOW_HEIGHT = CONFIG.WINDOW_HEIGHT
+BLACK = CONFIG.BLACK
+WHITE = CONFIG.WHITE
+YELLOW = CONFIG.YELLOW
\ No newline at end of file
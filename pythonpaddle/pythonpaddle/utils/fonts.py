@@ -0,0 +1,18 @@
+"""Font cache for the pythonpaddle game."""
+import functools
+import pygame
+
+
+@functools.lru_cache(maxsize=None)
+def get_font(size, name=None):
+    """
+    Get a font, loading it only the first time it is requested.
+    
+    Args:
+        size: Font size in pixels
+        name: Font file name, or None for pygame's default font
+    
+    Returns:
+        pygame.font.Font: The shared font object
+    """
+    return pygame.font.Font(name, size)
\ No newline at end of file
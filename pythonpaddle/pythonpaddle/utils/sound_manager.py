@@ -1,82 +1,82 @@
 """Sound manager for the pythonpaddle game."""
+import functools
+import io
 import os
+from enum import IntEnum
 import pygame
 from pythonpaddle.utils.config import CONFIG
 
+# Directory holding the sound effect files
+_SOUND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "assets", "sounds")
+
+# Minimal silent WAV file, used in place of any sound file that is missing
+_SILENT_WAV = b"RIFF\x24\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x44\xAC\x00\x00\x88\x58\x01\x00\x02\x00\x10\x00data\x00\x00\x00\x00"
+
+
+class SoundId(IntEnum):
+    """Identifiers for the game's sound effects, used as indices into SoundManager.sounds."""
+    PADDLE_HIT = 0
+    WALL_HIT = 1
+    SCORE = 2
+
 
 class SoundManager:
     """Manages sound effects for the game."""
     
+    # File and relative volume for each sound effect, in SoundId order
+    _SOUND_SPECS = (
+        (SoundId.PADDLE_HIT, "paddle_hit.wav", 0.5),
+        (SoundId.WALL_HIT, "wall_hit.wav", 0.4),
+        (SoundId.SCORE, "score.wav", 0.6)
+    )
+    
     def __init__(self):
         """Initialize the sound manager."""
-        self.sounds = {}
+        self.sounds = [None] * len(SoundId)
+        self._loaded = False
         self.enabled = CONFIG.SOUND_ENABLED
         self.volume = CONFIG.SOUND_VOLUME
         
         # Try to initialize the mixer
         try:
-            pygame.mixer.init()
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
             pygame.mixer.set_num_channels(8)
         except pygame.error:
             print("Warning: Sound system could not be initialized")
             self.enabled = False
-        
-        # Create base directories and placeholder sounds
-        self._ensure_sound_files()
-    
-    def _ensure_sound_files(self):
-        """Create sound directories and placeholder files if they don't exist."""
-        # Create assets/sounds directory
-        sound_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
-                                "assets", "sounds")
-        os.makedirs(sound_dir, exist_ok=True)
-        
-        # Create placeholder sound files if they don't exist
-        sound_files = {
-            "paddle_hit": "paddle_hit.wav",
-            "wall_hit": "wall_hit.wav",
-            "score": "score.wav"
-        }
-        
-        for sound_name, filename in sound_files.items():
-            sound_path = os.path.join(sound_dir, filename)
-            if not os.path.exists(sound_path):
-                print(f"Creating placeholder sound: {sound_path}")
-                with open(sound_path, "wb") as f:
-                    # Write minimal WAV file header
-                    f.write(b"RIFF\x24\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x44\xAC\x00\x00\x88\x58\x01\x00\x02\x00\x10\x00data\x00\x00\x00\x00")
     
     def load_sounds(self):
         """Load all sound effects."""
-        if not self.enabled:
+        if not self.enabled or self._loaded:
             return
         
-        sound_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
-                                "assets", "sounds")
-        
-        sound_files = {
-            "paddle_hit": "paddle_hit.wav",
-            "wall_hit": "wall_hit.wav",
-            "score": "score.wav"
-        }
-        
-        for sound_name, filename in sound_files.items():
-            sound_path = os.path.join(sound_dir, filename)
+        for sound_id, filename, _ in self._SOUND_SPECS:
+            sound_path = os.path.join(_SOUND_DIR, filename)
             try:
-                self.sounds[sound_name] = pygame.mixer.Sound(sound_path)
-                self.sounds[sound_name].set_volume(self.volume)
+                if os.path.exists(sound_path):
+                    sound = pygame.mixer.Sound(sound_path)
+                else:
+                    # Fall back to a silent placeholder built in memory
+                    sound = pygame.mixer.Sound(io.BytesIO(_SILENT_WAV))
+                self.sounds[sound_id] = sound
             except pygame.error:
                 print(f"Warning: Could not load sound {sound_path}")
+        
+        self._apply_volume()
+        self._loaded = True
     
-    def play(self, sound_name):
+    def play(self, sound_id):
         """
-        Play a sound effect by name.
+        Play a sound effect.
         
         Args:
-            sound_name: The name of the sound to play
+            sound_id: The SoundId of the sound to play
         """
-        if self.enabled and sound_name in self.sounds:
-            self.sounds[sound_name].play()
+        sound = self.sounds[sound_id]
+        if self.enabled and sound is not None:
+            sound.play()
     
     def set_volume(self, volume):
         """
@@ -86,10 +86,29 @@ class SoundManager:
             volume: Volume level (0.0 to 1.0)
         """
         self.volume = max(0.0, min(1.0, volume))
-        for sound in self.sounds.values():
-            sound.set_volume(self.volume)
+        self._apply_volume()
+    
+    def _apply_volume(self):
+        """Scale each loaded sound's relative volume by the master volume."""
+        for sound_id, _, relative_volume in self._SOUND_SPECS:
+            sound = self.sounds[sound_id]
+            if sound is not None:
+                sound.set_volume(self.volume * relative_volume)
     
     def toggle(self):
         """Toggle sound on/off."""
         self.enabled = not self.enabled
-        return self.enabled
\ No newline at end of file
+        return self.enabled
+
+
+@functools.lru_cache(maxsize=1)
+def get_sound_manager():
+    """
+    Get the process-wide sound manager, creating and loading it on first use.
+    
+    Returns:
+        SoundManager: The shared sound manager
+    """
+    sound_manager = SoundManager()
+    sound_manager.load_sounds()
+    return sound_manager
\ No newline at end of file
@@ -2,20 +2,20 @@
 Main entry point for the pythonpaddle game.
 This standalone script runs the game without requiring package installation.
 """
-import os
-import sys
 import pygame
 
-# Add the project root directory to Python's import path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 def main():
     """Initialize and run the game."""
     try:
+        # Configure a small mixer buffer for low-latency sound before pygame.init()
+        # initializes the mixer, so it doesn't have to be re-initialized later
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
+        
         # Initialize pygame
         pygame.init()
         
-        # Import the game engine (done here to ensure path is set first)
+        # Import the game engine (done here so import errors are reported below)
         from pythonpaddle.core.game_engine import GameEngine
         
         # Create and run the game engine
@@ -5,9 +5,13 @@ setup(
     name="pythonpaddle",
     version="0.1.0",
     packages=find_packages(),
+    python_requires=">=3.10",
     install_requires=[
         "pygame>=2.0.0",
     ],
+    extras_require={
+        "numba": ["numba"],
+    },
     entry_points={
         'console_scripts': [
             'pythonpaddle=pythonpaddle.main:main',
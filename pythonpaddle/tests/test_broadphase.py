@@ -0,0 +1,66 @@
+"""Tests for the broad-phase AABB tree."""
+import random
+import unittest
+from collections import namedtuple
+from pythonpaddle.core.broadphase import AABBTree
+
+# Minimal stand-in for pygame.Rect, so the tests don't need pygame
+Rect = namedtuple("Rect", "x y w h")
+
+
+def _random_rect(rng):
+    """Create a random rect inside an 800x600 window."""
+    return Rect(rng.randint(0, 780), rng.randint(0, 580), rng.randint(1, 100), rng.randint(1, 100))
+
+
+def _brute_force(rects, query, margin):
+    """Find the items whose fattened boxes overlap a query rect, one by one."""
+    qx0, qy0, qx1, qy1 = query.x, query.y, query.x + query.w, query.y + query.h
+    return {
+        item for item, r in rects.items()
+        if (r.x - margin < qx1 and r.x + r.w + margin > qx0 and
+            r.y - margin < qy1 and r.y + r.h + margin > qy0)
+    }
+
+
+class AABBTreeTest(unittest.TestCase):
+    """Check tree queries against a brute-force search."""
+
+    def test_query_matches_brute_force(self):
+        rng = random.Random(1234)
+        # With no margin the stored boxes stay equal to the rects
+        tree = AABBTree(margin=0)
+        rects = {}
+        for item in range(50):
+            rects[item] = _random_rect(rng)
+            tree.insert(item, rects[item])
+
+        for _ in range(20):
+            # Move some items, drop one and add one, then compare queries
+            for item in rng.sample(sorted(rects), 10):
+                rects[item] = _random_rect(rng)
+                tree.update(item, rects[item])
+            removed = rng.choice(sorted(rects))
+            tree.remove(removed)
+            del rects[removed]
+            new_item = max(rects) + 1
+            rects[new_item] = _random_rect(rng)
+            tree.update(new_item, rects[new_item])
+
+            self.assertEqual(len(tree), len(rects))
+            for _ in range(20):
+                query = _random_rect(rng)
+                self.assertEqual(set(tree.query(query)), _brute_force(rects, query, 0))
+
+    def test_moves_inside_margin_keep_box(self):
+        tree = AABBTree(margin=10)
+        tree.insert("paddle", Rect(20, 100, 10, 100))
+        self.assertFalse(tree.update("paddle", Rect(20, 107, 10, 100)))
+        self.assertTrue(tree.update("paddle", Rect(20, 150, 10, 100)))
+        # Queries only ever miss items that are really out of reach
+        self.assertEqual(tree.query(Rect(25, 145, 5, 5)), ["paddle"])
+        self.assertEqual(tree.query(Rect(500, 145, 5, 5)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()